@@ -1,9 +1,13 @@
+import argparse
 import pygame
 import math
 import random
+from GetMoonGame import compute_inputs, TRAINING_CLOCK_SPEED
+from demonstrations import DemoRecorder
 
 class MoonLanderGame:
-    def __init__(self):
+    def __init__(self, recorder=None):
+        self.recorder = recorder  # Records (features, action) pairs when set
         self.initialize_game()
 
     def initialize_game(self):
@@ -41,6 +45,13 @@ class MoonLanderGame:
         self.THRUST = 0.2
         self.ROTATION_SPEED = 3
         self.MAX_SPEED = 5
+        self.MAX_ANGULAR_VELOCITY = 10  # Only used to normalize recorded features
+        self.bounce = False
+
+        # Recorded demonstrations must come from the same physics the network trains in
+        if self.recorder is not None:
+            self.MAX_SPEED = 1
+            self.bounce = True
 
         # Initialize font
         pygame.font.init()
@@ -61,6 +72,7 @@ class MoonLanderGame:
         self.position = pygame.math.Vector2(self.WIDTH // 2, self.HEIGHT // 4)
         self.velocity = pygame.math.Vector2(0, 0)
         self.angle = 0
+        self.prev_angle = 0
         self.running = True
         self.score = 0
         self.thrust = False
@@ -90,6 +102,12 @@ class MoonLanderGame:
 
             # Key handling
             keys = pygame.key.get_pressed()
+
+            # Record what the network would see this frame and what the player did
+            if self.recorder is not None:
+                inputs = compute_inputs(self, 1 / TRAINING_CLOCK_SPEED)
+                self.recorder.record(inputs, [keys[pygame.K_LEFT], keys[pygame.K_RIGHT], keys[pygame.K_UP]])
+
             if keys[pygame.K_LEFT]:
                 self.angle += self.ROTATION_SPEED
             if keys[pygame.K_RIGHT]:
@@ -108,6 +126,13 @@ class MoonLanderGame:
             if self.velocity.length() > self.MAX_SPEED:
                 self.velocity.scale_to_length(self.MAX_SPEED)
 
+            # Bounce off the screen edges like the training game does
+            if self.bounce:
+                if self.position.x <= 0 or self.position.x >= self.WIDTH:
+                    self.velocity.x = -self.velocity.x
+                if self.position.y <= 0 or self.position.y >= self.HEIGHT:
+                    self.velocity.y = -self.velocity.y
+
             # Update position
             self.position += self.velocity
 
@@ -124,11 +149,17 @@ class MoonLanderGame:
                 self.generate_target_position()
                 self.initial_distance = self.position.distance_to(self.target_pos)  # Update initial distance
 
+            # Update previous angle
+            self.prev_angle = self.angle
+
             self.draw()
 
             # Tick the clock
             self.clock.tick(self.CLOCK_SPEED)
 
+        if self.recorder is not None:
+            self.recorder.save()
+
         pygame.quit()
 
     def draw(self):
@@ -171,5 +202,10 @@ class MoonLanderGame:
         pygame.display.flip()
 
 if __name__ == "__main__":
-    game = MoonLanderGame()
-    game.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", action="store_true",
+                        help="Save this session as a demonstration for warm-starting training")
+    args = parser.parse_args()
+
+    game = MoonLanderGame(recorder=DemoRecorder() if args.record else None)
+    game.run()
@@ -1,14 +1,70 @@
+import os
 import pygame
 import math
 import random
 
+# Frame rate the trainer runs at; the human game records features as if at this rate
+TRAINING_CLOCK_SPEED = 400
+
+def compute_inputs(game, elapsed_time):
+    # Feature vector fed to the network, shared with the human game so recorded
+    # demonstrations match what the network sees. elapsed_time is in seconds.
+
+    # Calculate X and Y distances to the target
+    x_distance = (game.target_pos.x - game.position.x) / game.WIDTH
+    y_distance = (game.target_pos.y - game.position.y) / game.HEIGHT
+
+    # Calculate angle to the moon
+    angle_to_moon = math.degrees(math.atan2(y_distance, x_distance))
+    normalized_angle = angle_to_moon / 180  # Normalize to -1 to 1 range
+
+    # Calculate normalized angular velocity
+    if elapsed_time > 0:  # Check if elapsed_time is greater than zero
+        angular_velocity = (game.angle - game.prev_angle) / elapsed_time
+        normalized_angular_velocity = angular_velocity / game.MAX_ANGULAR_VELOCITY
+    else:
+        normalized_angular_velocity = 0  # Set to zero if elapsed_time is zero
+
+    # Calculate relative velocity components
+    relative_velocity_x = (game.velocity.x - 0) / game.MAX_SPEED  # Assuming moon velocity is 0
+    relative_velocity_y = (game.velocity.y - 0) / game.MAX_SPEED  # Assuming moon velocity is 0
+
+    # Calculate distance ratio to nearest screen edge
+    distance_to_vertical_edge = min(game.position.x, game.WIDTH - game.position.x) / game.WIDTH
+    distance_to_horizontal_edge = min(game.position.y, game.HEIGHT - game.position.y) / game.HEIGHT
+
+    # Calculate angle between rocket direction and velocity vector
+    angle_between_direction_velocity = math.atan2(game.velocity.y, game.velocity.x) - math.radians(game.angle)
+
+    # Input values for the neural network
+    return [
+        game.position.x / game.WIDTH,
+        game.position.y / game.HEIGHT,
+        game.angle / 360,
+        game.velocity.x / game.MAX_SPEED,
+        game.velocity.y / game.MAX_SPEED,
+        game.position.distance_to(game.target_pos) / math.sqrt(game.WIDTH**2 + game.HEIGHT**2),  # Normalize by screen diagonal
+        x_distance,
+        y_distance,
+        normalized_angle,
+        normalized_angular_velocity,  # Add normalized angular velocity as input
+        relative_velocity_x,  # Add relative velocity X component as input
+        relative_velocity_y,  # Add relative velocity Y component as input
+        distance_to_vertical_edge,  # Add distance ratio to nearest vertical edge as input
+        distance_to_horizontal_edge,  # Add distance ratio to nearest horizontal edge as input
+        angle_between_direction_velocity  # Add angle between rocket direction and velocity vector as input
+    ]
+
 class MoonLanderGame:
-    def __init__(self, net):
+    def __init__(self, net, headless=False):
         self.net = net
+        self.headless = headless  # No window, no frame limiting, fixed time step
         self.initialize_game()
 
     def initialize_game(self):
         # Initialize Pygame
+        if self.headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
         pygame.init()
 
         # Set up the display
@@ -19,7 +75,7 @@ class MoonLanderGame:
         self.clock = pygame.time.Clock()
 
         # Clock tick rate
-        self.CLOCK_SPEED = 400
+        self.CLOCK_SPEED = TRAINING_CLOCK_SPEED
 
         # Maximum run time (in game seconds)
         self.MAX_RUN_TIME = 1000
@@ -47,6 +103,11 @@ class MoonLanderGame:
         self.MAX_SPEED = 1
         self.MAX_ANGULAR_VELOCITY = 10  # Maximum angular velocity constant
 
+        # Behaviour descriptor settings (used by novelty search)
+        self.GRID_COLS = 4
+        self.GRID_ROWS = 3
+        self.HIT_SCALE = 10  # Hits are divided by this to keep them on the same scale as positions
+
         # Initialize font
         pygame.font.init()
         self.font = pygame.font.Font(None, 36)
@@ -59,6 +120,9 @@ class MoonLanderGame:
             size = random.randint(1, 3)
             self.stars.append((x, y, size))
 
+        # Source of moon positions, replaced by a seeded generator for reproducible episodes
+        self.rng = random
+
         self.reset_game()
 
     def reset_game(self):
@@ -90,14 +154,37 @@ class MoonLanderGame:
 
     def generate_target_position(self):
         while True:
-            x = random.randint(self.target_radius, self.WIDTH - self.target_radius)
-            y = random.randint(self.target_radius, self.HEIGHT - self.target_radius)
+            x = self.rng.randint(self.target_radius, self.WIDTH - self.target_radius)
+            y = self.rng.randint(self.target_radius, self.HEIGHT - self.target_radius)
             self.target_pos = pygame.math.Vector2(x, y)
             self.moon_rect.center = self.target_pos
             if self.target_pos.distance_to(self.position) > 100:
                 break
 
+    def frame_time(self):
+        # Milliseconds covered by the current frame
+        if self.headless:
+            return 1000 / self.CLOCK_SPEED  # Same step the clock would give at full speed
+        return self.clock.get_time()
+
     def run_genome(self, genome, generation):
+        fitness = self.play_episode()
+        if fitness is None:
+            return
+
+        # Write the fitness value to a file
+        with open('fitness_values.txt', 'a') as file:
+            file.write(f"Generation {generation}, Genome {genome.key}: {fitness:.2f}\n")
+
+        # Display fitness score for the current genome
+        print(f"Genome {genome.key}: {fitness:.2f}")
+
+        return fitness
+
+    def play_episode(self, max_frames=None, seed=None):
+        # The same seed always produces the same sequence of moons
+        self.rng = random if seed is None else random.Random(seed)
+
         # Initialize game state
         self.position = pygame.math.Vector2(self.WIDTH // 2, self.HEIGHT // 4)
         self.velocity = pygame.math.Vector2(0, 0)
@@ -124,58 +211,27 @@ class MoonLanderGame:
         self.zero_x_movement_time = 0
         self.penalty_applied = False
 
-        while self.running and self.timer < self.MAX_RUN_TIME:
-            # Event handling
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-
-            # Calculate X and Y distances to the target
-            x_distance = (self.target_pos.x - self.position.x) / self.WIDTH
-            y_distance = (self.target_pos.y - self.position.y) / self.HEIGHT
-
-            # Calculate angle to the moon
-            angle_to_moon = math.degrees(math.atan2(y_distance, x_distance))
-            normalized_angle = angle_to_moon / 180  # Normalize to -1 to 1 range
-
-            # Calculate normalized angular velocity
-            elapsed_time = self.clock.get_time() / 1000  # Convert milliseconds to seconds
-            if elapsed_time > 0:  # Check if elapsed_time is greater than zero
-                angular_velocity = (self.angle - self.prev_angle) / elapsed_time
-                normalized_angular_velocity = angular_velocity / self.MAX_ANGULAR_VELOCITY
-            else:
-                normalized_angular_velocity = 0  # Set to zero if elapsed_time is zero
+        # Frame counter, used to cap episodes where the timer keeps being reset by moon hits
+        self.frames = 0
 
-            # Calculate relative velocity components
-            relative_velocity_x = (self.velocity.x - 0) / self.MAX_SPEED  # Assuming moon velocity is 0
-            relative_velocity_y = (self.velocity.y - 0) / self.MAX_SPEED  # Assuming moon velocity is 0
+        # Behaviour tracking: moon hits and frames spent in each screen cell
+        self.hits = 0
+        self.visits = [0] * (self.GRID_COLS * self.GRID_ROWS)
 
-            # Calculate distance ratio to nearest screen edge
-            distance_to_vertical_edge = min(self.position.x, self.WIDTH - self.position.x) / self.WIDTH
-            distance_to_horizontal_edge = min(self.position.y, self.HEIGHT - self.position.y) / self.HEIGHT
+        while self.running and self.timer < self.MAX_RUN_TIME:
+            if max_frames is not None and self.frames >= max_frames:
+                break
+            self.frames += 1
 
-            # Calculate angle between rocket direction and velocity vector
-            angle_between_direction_velocity = math.atan2(self.velocity.y, self.velocity.x) - math.radians(self.angle)
+            # Event handling
+            if not self.headless:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        return
 
             # Get input values for the neural network
-            inputs = [
-                self.position.x / self.WIDTH,
-                self.position.y / self.HEIGHT,
-                self.angle / 360,
-                self.velocity.x / self.MAX_SPEED,
-                self.velocity.y / self.MAX_SPEED,
-                self.position.distance_to(self.target_pos) / math.sqrt(self.WIDTH**2 + self.HEIGHT**2),  # Normalize by screen diagonal
-                x_distance,
-                y_distance,
-                normalized_angle,
-                normalized_angular_velocity,  # Add normalized angular velocity as input
-                relative_velocity_x,  # Add relative velocity X component as input
-                relative_velocity_y,  # Add relative velocity Y component as input
-                distance_to_vertical_edge,  # Add distance ratio to nearest vertical edge as input
-                distance_to_horizontal_edge,  # Add distance ratio to nearest horizontal edge as input
-                angle_between_direction_velocity  # Add angle between rocket direction and velocity vector as input
-            ]
+            inputs = compute_inputs(self, self.frame_time() / 1000)  # Convert milliseconds to seconds
 
             # Get the output from the neural network
             outputs = self.net.activate(inputs)
@@ -212,7 +268,7 @@ class MoonLanderGame:
             self.rocket_rect.center = self.position
 
             # Update timer based on clock speed
-            elapsed_time = self.clock.get_time()
+            elapsed_time = self.frame_time()
             self.timer += elapsed_time * (60 / self.CLOCK_SPEED)
 
             # Check if the rocket's speed is zero
@@ -236,6 +292,7 @@ class MoonLanderGame:
             # Check if the rocket collides with the moon
             if self.rocket_rect.colliderect(self.moon_rect):
                 self.score += 500  # Add a reward of 100 for hitting the moon
+                self.hits += 1
                 self.generate_target_position()
                 self.initial_distance = self.position.distance_to(self.target_pos)  # Update initial distance
                 self.timer = 0  # Reset the timer when the rocket reaches the moon
@@ -244,28 +301,32 @@ class MoonLanderGame:
             self.position.x = max(0, min(self.position.x, self.WIDTH))
             self.position.y = max(0, min(self.position.y, self.HEIGHT))
 
+            # Record which screen cell the rocket is in
+            col = min(int(self.position.x / self.WIDTH * self.GRID_COLS), self.GRID_COLS - 1)
+            row = min(int(self.position.y / self.HEIGHT * self.GRID_ROWS), self.GRID_ROWS - 1)
+            self.visits[row * self.GRID_COLS + col] += 1
+
             # Update previous angle
             self.prev_angle = self.angle
 
-            self.draw()
+            if not self.headless:
+                self.draw()
 
-            # Tick the clock
-            self.clock.tick(self.CLOCK_SPEED)
+                # Tick the clock
+                self.clock.tick(self.CLOCK_SPEED)
 
         # Calculate fitness based on distance to target
         current_distance = self.position.distance_to(self.target_pos)
         distance_fitness = (self.initial_distance - current_distance) / self.initial_distance
 
-        fitness = distance_fitness + self.score  # Include the score in the fitness calculation
+        return distance_fitness + self.score  # Include the score in the fitness calculation
 
-        # Write the fitness value to a file
-        with open('fitness_values.txt', 'a') as file:
-            file.write(f"Generation {generation}, Genome {genome.key}: {fitness:.2f}\n")
-
-        # Display fitness score for the current genome
-        print(f"Genome {genome.key}: {fitness:.2f}")
-
-        return fitness
+    def behaviour(self):
+        # Descriptor of the last episode: final position, visited-cell histogram and hit count
+        frames = max(self.frames, 1)
+        return ([self.position.x / self.WIDTH, self.position.y / self.HEIGHT]
+                + [count / frames for count in self.visits]
+                + [self.hits / self.HIT_SCALE])
 
     def draw(self):
         # Fill the screen with black color
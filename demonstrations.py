@@ -0,0 +1,53 @@
+# demonstrations.py
+#
+# Human play recorded as (15-input feature vector, action) pairs. Each session
+# is saved as its own compressed .npz file in the demos directory:
+#   inputs  - float32, one row of 15 features per frame
+#   actions - uint8, one row of 3 flags per frame (rotate left, rotate right, thrust),
+#             in the same order as the network's outputs
+
+import glob
+import os
+import time
+
+import numpy as np
+
+DEMO_DIR = "demos"
+
+
+class DemoRecorder:
+    def __init__(self, directory=DEMO_DIR):
+        self.directory = directory
+        self.inputs = []
+        self.actions = []
+
+    def record(self, inputs, actions):
+        self.inputs.append(inputs)
+        self.actions.append(actions)
+
+    def save(self):
+        if not self.inputs:
+            return None
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"demo-{time.strftime('%Y%m%d-%H%M%S')}.npz")
+        np.savez_compressed(path,
+                            inputs=np.asarray(self.inputs, dtype=np.float32),
+                            actions=np.asarray(self.actions, dtype=np.uint8))
+        print(f"Saved {len(self.inputs)} demonstration frames to {path}")
+        return path
+
+
+def load_demos(directory=DEMO_DIR):
+    # All sessions in the directory, concatenated
+    paths = sorted(glob.glob(os.path.join(directory, "*.npz")))
+    if not paths:
+        raise FileNotFoundError(f"No demonstrations found in {directory}")
+
+    inputs = []
+    actions = []
+    for path in paths:
+        with np.load(path) as data:
+            inputs.append(data["inputs"])
+            actions.append(data["actions"])
+    return np.concatenate(inputs), np.concatenate(actions)
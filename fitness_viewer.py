@@ -0,0 +1,58 @@
+# fitness_viewer.py
+#
+# Run alongside main.py to watch training live. The viewer can be closed and
+# restarted at any time; the trainer never waits for it.
+
+import pygame
+from fitness_display import FitnessDisplay
+from telemetry import TelemetryListener
+
+PANEL_WIDTH = 600
+PANEL_HEIGHT = 300
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((PANEL_WIDTH, PANEL_HEIGHT * 2))
+    pygame.display.set_caption("NEAT Fitness")
+    clock = pygame.time.Clock()
+
+    listener = TelemetryListener()
+
+    # Top panel shows every genome, bottom panel shows the best of each generation
+    genome_display = FitnessDisplay(PANEL_WIDTH, PANEL_HEIGHT)
+    generation_display = FitnessDisplay(PANEL_WIDTH, PANEL_HEIGHT)
+    genome_surface = genome_display.surface
+    generation_surface = generation_display.surface
+
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+
+        for message in listener.poll():
+            if message.get("type") == "genome":
+                if message.get("fitness") is None:
+                    continue  # Sent when the training window was closed mid-episode
+                genome_surface = genome_display.update(message["genome"], message["fitness"])
+            elif message.get("type") == "generation":
+                if message.get("best") is None:
+                    continue
+                generation_surface = generation_display.update(message["generation"], message["best"])
+                pygame.display.set_caption(f"NEAT Fitness - Generation {message['generation']}")
+
+        screen.blit(genome_surface, (0, 0))
+        screen.blit(generation_surface, (0, PANEL_HEIGHT))
+        pygame.display.flip()
+
+        clock.tick(30)
+
+    listener.close()
+    genome_display.close()
+    generation_display.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# headless_eval.py
+#
+# Genome evaluation for worker processes: no window, no frame limiting.
+
+import contextlib
+import multiprocessing
+
+import neat
+from GetMoonGame import MoonLanderGame
+
+# Longest episode a worker will simulate (about 2.5 minutes of game time at 400 FPS)
+MAX_EPISODE_FRAMES = 60000
+
+# One game per worker process so the images are only loaded once
+_game = None
+
+
+def get_game(net):
+    global _game
+    if _game is None:
+        _game = MoonLanderGame(net, headless=True)
+    else:
+        _game.net = net
+    return _game
+
+
+def eval_genome(genome, config):
+    net = neat.nn.FeedForwardNetwork.create(genome, config)
+    return get_game(net).play_episode(max_frames=MAX_EPISODE_FRAMES)
+
+
+@contextlib.contextmanager
+def worker_pool(workers, initializer=None, initargs=()):
+    pool = multiprocessing.Pool(workers, initializer=initializer, initargs=initargs)
+    try:
+        yield pool
+    finally:
+        # pygame swallows SIGTERM in the workers, so the pool's terminate()
+        # would hang; let them finish their queue and exit on their own
+        pool.close()
+        pool.join()
@@ -1,26 +1,90 @@
+import argparse
+import copy
 import neat
 import pickle
 from GetMoonGame import MoonLanderGame
 from functools import partial
+from telemetry import TelemetryReporter
 
-def eval_genomes(genomes, config, generation):
+# Fitness points per unit of novelty when novelty search is enabled. Novelty
+# scores are typically around 1, so this keeps the bonus below one moon hit (500)
+NOVELTY_WEIGHT = 100
+
+class GameScoreReached(Exception):
+    # Ends a novelty run once the game score alone reaches fitness_threshold
+    pass
+
+def eval_genomes(genomes, config, generation, telemetry=None):
     for genome_id, genome in genomes:
         net = neat.nn.FeedForwardNetwork.create(genome, config)
         game = MoonLanderGame(net)
         genome.fitness = game.run_genome(genome, generation)  # Pass the generation number to run_genome
+        if telemetry is not None:
+            telemetry.genome_evaluated(genome)  # Fire-and-forget, never waits for a viewer
+
+def eval_genomes_novelty(genomes, config, generation, archive, novelty_weight, best, telemetry=None):
+    # Play every genome first, novelty is relative to the whole population
+    objectives = []
+    behaviours = []
+    for genome_id, genome in genomes:
+        net = neat.nn.FeedForwardNetwork.create(genome, config)
+        game = MoonLanderGame(net)
+        objective = game.run_genome(genome, generation)
+        objectives.append(objective)
+        behaviours.append(game.behaviour())
+
+        # The winner is judged on the game score alone, not the novelty bonus
+        if best["score"] is None or objective > best["score"]:
+            best["score"] = objective
+            best["genome"] = copy.deepcopy(genome)
 
-def run(config_path):
+    novelty = archive.score(behaviours)
+
+    # Quality-diversity: keep the game score and add a bonus for novel behaviour
+    for (genome_id, genome), objective, genome_novelty in zip(genomes, objectives, novelty):
+        genome.fitness = objective + novelty_weight * genome_novelty
+        if telemetry is not None:
+            telemetry.genome_evaluated(genome)
+
+    print(f"Novelty archive: {len(archive)} behaviours, threshold {archive.threshold:.3f}")
+
+    if best["score"] >= config.fitness_threshold:
+        raise GameScoreReached()
+
+def run(config_path, novelty=False, demo_dir=None, novelty_weight=NOVELTY_WEIGHT):
     config = neat.config.Config(neat.DefaultGenome, neat.DefaultReproduction,
                                 neat.DefaultSpeciesSet, neat.DefaultStagnation,
                                 config_path)
 
     p = neat.Population(config)
 
+    if demo_dir is not None:
+        from warm_start import warm_start
+        warm_start(p, config, demo_dir)  # Fit the starting weights to recorded human play
+
     p.add_reporter(neat.StdOutReporter(True))
     stats = neat.StatisticsReporter()
     p.add_reporter(stats)
+    telemetry = TelemetryReporter()
+    p.add_reporter(telemetry)  # Live fitness for fitness_viewer.py
+
+    if novelty:
+        from novelty import NoveltyArchive
+        best = {"score": None, "genome": None}
+        fitness_function = partial(eval_genomes_novelty, generation=p.generation,
+                                   archive=NoveltyArchive(), novelty_weight=novelty_weight,
+                                   best=best, telemetry=telemetry)
 
-    winner = p.run(partial(eval_genomes, generation=p.generation), 50000)
+        # neat would stop on the combined fitness; the evaluation ends the run on the game score instead
+        config.no_fitness_termination = True
+        try:
+            p.run(fitness_function, 50000)
+        except GameScoreReached:
+            pass
+        winner = best["genome"]
+        winner.fitness = best["score"]
+    else:
+        winner = p.run(partial(eval_genomes, generation=p.generation, telemetry=telemetry), 50000)
 
     with open('winner.pkl', 'wb') as f:
         pickle.dump(winner, f)
@@ -28,5 +92,14 @@ def run(config_path):
     print('\nBest genome:\n{!s}'.format(winner))
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--novelty', action='store_true',
+                        help='Reward novel behaviour as well as the game score')
+    parser.add_argument('--novelty-weight', type=float, default=NOVELTY_WEIGHT,
+                        help='Fitness points per unit of novelty (default %(default)s)')
+    parser.add_argument('--demos', metavar='DIR', default=None,
+                        help='Seed the initial population from demonstrations recorded with GetMoonGame-Human.py --record')
+    args = parser.parse_args()
+
     config_path = 'config-feedforward.txt'
-    run(config_path)
+    run(config_path, novelty=args.novelty, demo_dir=args.demos, novelty_weight=args.novelty_weight)
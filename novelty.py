@@ -0,0 +1,57 @@
+# novelty.py
+#
+# Novelty search: a genome is rewarded for behaving differently from the
+# current population and from an archive of earlier behaviours. Nearest
+# neighbours come from a KD-tree, so large archives stay cheap to query.
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+class NoveltyArchive:
+    def __init__(self, k=15, threshold=0.2, max_additions=5):
+        self.k = k  # Neighbours averaged into the novelty score
+        self.threshold = threshold  # Novelty needed to enter the archive
+        self.max_additions = max_additions  # Above this many additions per generation the threshold rises
+
+        self.behaviours = None  # Array of archived descriptors, one per row
+        self.tree = None  # Rebuilt only when the archive changes
+
+    def __len__(self):
+        return 0 if self.behaviours is None else len(self.behaviours)
+
+    def score(self, behaviours):
+        # Returns the novelty of each behaviour and archives the most novel ones
+        points = np.asarray(behaviours, dtype=float)
+
+        # Neighbours within the population (the first hit is the point itself)
+        k_population = min(self.k + 1, len(points))
+        distances, _ = cKDTree(points).query(points, k=k_population, workers=-1)
+        distances = distances.reshape(len(points), -1)[:, 1:]
+
+        # Neighbours in the archive, merged with the population ones
+        if self.tree is not None:
+            k_archive = min(self.k, len(self))
+            archive_distances, _ = self.tree.query(points, k=k_archive, workers=-1)
+            distances = np.hstack([distances, archive_distances.reshape(len(points), -1)])
+
+        if distances.shape[1] == 0:
+            novelty = np.zeros(len(points))
+        else:
+            distances.sort(axis=1)
+            novelty = distances[:, :self.k].mean(axis=1)
+
+        self.update_archive(points, novelty)
+        return novelty.tolist()
+
+    def update_archive(self, points, novelty):
+        added = points[novelty > self.threshold]
+        if len(added):
+            self.behaviours = added if self.behaviours is None else np.vstack([self.behaviours, added])
+            self.tree = cKDTree(self.behaviours)
+
+        # Keep the archive growing at a steady pace
+        if len(added) > self.max_additions:
+            self.threshold *= 1.1
+        elif len(added) == 0:
+            self.threshold *= 0.95
@@ -0,0 +1,129 @@
+# score_genomes.py
+#
+# Offline scoring of saved genomes over many seeded, headless episodes.
+# Episode i uses seed (--seed + i) for every genome, so all genomes start with
+# the same first moon and the same random stream. Later moons can differ, since
+# how many draws a new moon takes depends on where the rocket is.
+#
+# Example:
+#   python score_genomes.py winner.pkl "winner copy.pkl" --episodes 2000 --output episodes.csv
+
+import argparse
+import csv
+import os
+import pickle
+import time
+
+import neat
+import numpy as np
+from headless_eval import get_game, worker_pool
+
+PERCENTILES = [5, 25, 50, 75, 95]
+
+# Per-worker state, filled in by init_worker
+_nets = None
+_max_frames = None
+
+
+def load_config(config_path):
+    return neat.config.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                              neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                              config_path)
+
+
+def load_genomes(genome_paths):
+    genomes = []
+    for path in genome_paths:
+        with open(path, 'rb') as f:
+            genomes.append(pickle.load(f))
+    return genomes
+
+
+def init_worker(genomes, config, max_frames):
+    # Build every network once per worker so tasks only carry (index, seed)
+    global _nets, _max_frames
+    _nets = [neat.nn.FeedForwardNetwork.create(genome, config) for genome in genomes]
+    _max_frames = max_frames
+
+
+def play(task):
+    genome_index, seed = task
+    game = get_game(_nets[genome_index])
+    fitness = game.play_episode(max_frames=_max_frames, seed=seed)
+    return genome_index, seed, fitness, game.hits, game.frames
+
+
+def summarize(path, results, max_frames):
+    fitness = np.array([r[0] for r in results])
+    hits = np.array([r[1] for r in results])
+    frames = np.array([r[2] for r in results])
+
+    print(f"\n{path}  ({len(results)} episodes)")
+    print(f"  fitness  mean {fitness.mean():.2f}  std {fitness.std():.2f}  "
+          + "  ".join(f"p{p} {v:.2f}" for p, v in zip(PERCENTILES, np.percentile(fitness, PERCENTILES))))
+    print(f"  hits     rate {np.mean(hits > 0):.1%}  mean {hits.mean():.2f}  max {hits.max()}")
+    print(f"  frames   mean {frames.mean():.0f}  "
+          + "  ".join(f"p{p} {v:.0f}" for p, v in zip(PERCENTILES, np.percentile(frames, PERCENTILES)))
+          + f"  capped {np.mean(frames >= max_frames):.1%}")
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score saved genomes over many seeded headless episodes.")
+    parser.add_argument("genomes", nargs="+", help="Pickled genome files")
+    parser.add_argument("--config", default="config-feedforward.txt")
+    parser.add_argument("--episodes", type=positive_int, default=1000, help="Episodes per genome")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first episode")
+    parser.add_argument("--max-frames", type=int, default=20000,
+                        help="Frame cap per episode (400 frames = 1 second at training speed)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--output", default=None, help="Optional CSV file receiving one row per episode")
+    args = parser.parse_args()
+
+    # Load everything up front: an error inside the pool initializer would make
+    # every worker die and be replaced forever instead of stopping the program
+    try:
+        config = load_config(args.config)
+        genomes = load_genomes(args.genomes)
+    except (OSError, pickle.UnpicklingError) as e:
+        parser.error(str(e))
+
+    tasks = [(index, args.seed + episode)
+             for index in range(len(args.genomes))
+             for episode in range(args.episodes)]
+    results = {index: [] for index in range(len(args.genomes))}
+
+    output = open(args.output, "w", newline="") if args.output else None
+    writer = csv.writer(output) if output else None
+    if writer:
+        writer.writerow(["genome", "seed", "fitness", "hits", "frames"])
+
+    start = time.time()
+    try:
+        with worker_pool(args.workers, initializer=init_worker,
+                         initargs=(genomes, config, args.max_frames)) as pool:
+            # Results stream back as soon as each chunk of episodes finishes
+            for done, (index, seed, fitness, hits, frames) in enumerate(
+                    pool.imap_unordered(play, tasks, chunksize=8), start=1):
+                results[index].append((fitness, hits, frames))
+                if writer:
+                    writer.writerow([args.genomes[index], seed, f"{fitness:.2f}", hits, frames])
+                if done % 100 == 0 or done == len(tasks):
+                    print(f"\r{done}/{len(tasks)} episodes, {time.time() - start:.1f}s", end="", flush=True)
+    finally:
+        if output:
+            output.close()
+    print()
+
+    for index, path in enumerate(args.genomes):
+        summarize(path, results[index], args.max_frames)
+
+
+if __name__ == "__main__":
+    main()
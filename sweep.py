@@ -0,0 +1,240 @@
+# sweep.py
+#
+# Hyperparameter sweep over config-feedforward.txt. Many NEAT populations run
+# at once, each in its own thread, and all of them send their genomes to one
+# shared pool of worker processes.
+#
+# Examples:
+#   python sweep.py --grid pop_size=50,100,150 --grid compatibility_threshold=2.5,3.0
+#   python sweep.py --random weight_mutate_rate=0.3:0.9 --random max_stagnation=10:40 --samples 12
+
+import argparse
+import configparser
+import csv
+import itertools
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import neat
+from headless_eval import eval_genome, worker_pool
+
+
+def parse_value(text):
+    # Keep config values typed so random ranges know whether to draw ints
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_grid(specs):
+    grid = {}
+    for spec in specs:
+        key, values = spec.split("=", 1)
+        grid[key.strip()] = [parse_value(v.strip()) for v in values.split(",")]
+    return grid
+
+
+def parse_random(specs):
+    ranges = {}
+    for spec in specs:
+        key, bounds = spec.split("=", 1)
+        low, high = bounds.split(":", 1)
+        ranges[key.strip()] = (parse_value(low.strip()), parse_value(high.strip()))
+    return ranges
+
+
+def build_overrides(grid, ranges, samples, rng):
+    # Every grid combination, each paired with `samples` random draws
+    keys = list(grid)
+    overrides = []
+    for combo in itertools.product(*(grid[key] for key in keys)):
+        for _ in range(samples if ranges else 1):
+            override = dict(zip(keys, combo))
+            for key, (low, high) in ranges.items():
+                if isinstance(low, int) and isinstance(high, int):
+                    override[key] = rng.randint(low, high)
+                else:
+                    override[key] = round(rng.uniform(low, high), 4)
+            overrides.append(override)
+    return overrides
+
+
+def write_config(base_path, override, out_path):
+    parser = configparser.ConfigParser()
+    parser.read(base_path)
+    for key, value in override.items():
+        sections = [s for s in parser.sections() if parser.has_option(s, key)]
+        if not sections:
+            raise ValueError(f"Unknown config key: {key}")
+        parser.set(sections[0], key, str(value))
+    with open(out_path, "w") as f:
+        parser.write(f)
+
+
+class MedianStopper:
+    # Median stopping rule: after a grace period, a run is stopped as soon as
+    # its best-so-far fitness falls below the median best-so-far of the other
+    # runs at the same generation. Finished runs (solved, stopped or extinct)
+    # keep counting with their last value, since best-so-far never goes down.
+    def __init__(self, grace):
+        self.grace = grace
+        self.curves = {}
+        self.finished = set()
+        self.lock = threading.Lock()
+
+    def record(self, run_id, best_fitness):
+        with self.lock:
+            self.curves.setdefault(run_id, []).append(best_fitness)
+
+    def finish(self, run_id):
+        with self.lock:
+            self.finished.add(run_id)
+
+    def should_stop(self, run_id):
+        with self.lock:
+            curve = self.curves[run_id]
+            generation = len(curve) - 1
+            if generation < self.grace:
+                return False
+            others = [c[min(generation, len(c) - 1)] for r, c in self.curves.items()
+                      if r != run_id and c and (len(c) > generation or r in self.finished)]
+            return bool(others) and curve[-1] < statistics.median(others)
+
+
+class SweepRun:
+    def __init__(self, run_id, override, config_path):
+        self.run_id = run_id
+        self.override = override
+        self.config_path = config_path
+        self.status = "pending"
+        self.generations = 0
+        self.generations_to_threshold = None
+        self.best_fitness = None
+        self.wall_time = 0.0
+
+
+def evaluate_on_pool(genomes, config, pool):
+    fitnesses = pool.starmap(eval_genome, [(genome, config) for _, genome in genomes])
+    for (_, genome), fitness in zip(genomes, fitnesses):
+        genome.fitness = fitness
+
+
+def run_config(run, pool, stopper, max_generations, threshold):
+    config = neat.config.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                neat.DefaultSpeciesSet, neat.DefaultStagnation,
+                                run.config_path)
+    config.no_fitness_termination = True  # The loop below stops on --threshold itself
+    p = neat.Population(config)
+
+    def evaluate(genomes, config):
+        evaluate_on_pool(genomes, config, pool)
+
+    start = time.time()
+    run.status = "max_generations"
+    try:
+        # Step one generation at a time so the curve can be checked in between
+        for generation in range(max_generations):
+            p.run(evaluate, 1)
+            run.generations = generation + 1
+            run.best_fitness = p.best_genome.fitness
+            stopper.record(run.run_id, run.best_fitness)
+
+            if run.best_fitness >= threshold:
+                run.generations_to_threshold = run.generations
+                run.status = "reached"
+                break
+            if stopper.should_stop(run.run_id):
+                run.status = "stopped"
+                break
+    except neat.CompleteExtinctionException:
+        run.status = "extinct"
+    finally:
+        stopper.finish(run.run_id)
+    run.wall_time = time.time() - start
+
+    best = f"{run.best_fitness:.2f}" if run.best_fitness is not None else "-"
+    print(f"Run {run.run_id} {run.override}: {run.status} after {run.generations} generations, "
+          f"best {best}, {run.wall_time:.1f}s")
+    return run
+
+
+def write_summary(runs, path):
+    keys = sorted({key for run in runs for key in run.override})
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["run"] + keys + ["status", "generations", "generations_to_threshold",
+                                          "best_fitness", "wall_time_s"])
+        for run in runs:
+            writer.writerow([run.run_id] + [run.override.get(key, "") for key in keys] + [
+                run.status,
+                run.generations,
+                run.generations_to_threshold if run.generations_to_threshold is not None else "",
+                f"{run.best_fitness:.2f}" if run.best_fitness is not None else "",
+                f"{run.wall_time:.1f}",
+            ])
+
+    # Same table on stdout, best runs first
+    print(f"\n{'run':>4} {'status':>16} {'gens':>5} {'to_thr':>6} {'best':>9} {'time_s':>8}  overrides")
+    ranked = sorted(runs, key=lambda r: (r.generations_to_threshold is None,
+                                         r.generations_to_threshold or 0,
+                                         -(r.best_fitness or 0)))
+    for run in ranked:
+        to_threshold = run.generations_to_threshold if run.generations_to_threshold is not None else "-"
+        best = f"{run.best_fitness:.2f}" if run.best_fitness is not None else "-"
+        print(f"{run.run_id:>4} {run.status:>16} {run.generations:>5} {to_threshold:>6} "
+              f"{best:>9} {run.wall_time:>8.1f}  {run.override}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep NEAT config values over a shared worker pool.")
+    parser.add_argument("--config", default="config-feedforward.txt")
+    parser.add_argument("--grid", action="append", default=[], metavar="KEY=V1,V2,...",
+                        help="Try every listed value of KEY")
+    parser.add_argument("--random", action="append", default=[], metavar="KEY=LOW:HIGH",
+                        help="Draw KEY uniformly from [LOW, HIGH] (integers if both bounds are)")
+    parser.add_argument("--samples", type=int, default=8, help="Random draws per grid combination")
+    parser.add_argument("--generations", type=int, default=100, help="Generation budget per config")
+    parser.add_argument("--threshold", type=float, default=300,
+                        help="Fitness that counts as solved. The default 300 means at least one moon hit: "
+                             "no hit scores about 1 or less, one hit about 400 (500 minus the stall penalty) or more")
+    parser.add_argument("--grace", type=int, default=10,
+                        help="Generations before a run can be stopped early; after that a run stops once "
+                             "its best is below the median best-so-far of all other runs, finished ones included")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--concurrent", type=int, default=4, help="Populations evolving at once")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default="sweep_results.csv")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    overrides = build_overrides(parse_grid(args.grid), parse_random(args.random), args.samples, rng)
+
+    config_dir = tempfile.mkdtemp(prefix="neat-sweep-")
+    runs = []
+    for run_id, override in enumerate(overrides):
+        config_path = os.path.join(config_dir, f"config-{run_id}.txt")
+        write_config(args.config, override, config_path)
+        runs.append(SweepRun(run_id, override, config_path))
+    print(f"Sweeping {len(runs)} configs, configs written to {config_dir}")
+
+    stopper = MedianStopper(args.grace)
+    with worker_pool(args.workers) as pool:
+        with ThreadPoolExecutor(max_workers=args.concurrent) as executor:
+            futures = [executor.submit(run_config, run, pool, stopper, args.generations, args.threshold)
+                       for run in runs]
+            for future in futures:
+                future.result()
+
+    write_summary(runs, args.output)
+
+
+if __name__ == "__main__":
+    main()
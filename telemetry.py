@@ -0,0 +1,87 @@
+# telemetry.py
+
+import json
+import socket
+import neat
+
+# Local address the trainer publishes to and the viewer listens on
+TELEMETRY_HOST = "127.0.0.1"
+TELEMETRY_PORT = 50007
+
+# Largest datagram the viewer will read in one go
+MAX_MESSAGE_SIZE = 4096
+
+
+class TelemetryPublisher:
+    def __init__(self, host=TELEMETRY_HOST, port=TELEMETRY_PORT):
+        self.address = (host, port)
+
+        # UDP never waits for a reader: with no viewer attached (or a slow one)
+        # the kernel simply discards the datagram instead of stalling training
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+
+        # Count of messages we failed to hand to the kernel
+        self.dropped = 0
+
+    def publish(self, message):
+        try:
+            self.sock.sendto(json.dumps(message).encode(), self.address)
+        except OSError:
+            # Send buffer full or nobody listening - drop rather than block
+            self.dropped += 1
+
+    def close(self):
+        self.sock.close()
+
+
+class TelemetryReporter(neat.reporting.BaseReporter):
+    def __init__(self, publisher=None):
+        self.publisher = publisher if publisher is not None else TelemetryPublisher()
+        self.generation = 0
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def genome_evaluated(self, genome):
+        # Called from the evaluation loop once a genome has its fitness
+        self.publisher.publish({
+            "type": "genome",
+            "generation": self.generation,
+            "genome": genome.key,
+            "fitness": genome.fitness,
+        })
+
+    def post_evaluate(self, config, population, species, best_genome):
+        fitnesses = [genome.fitness for genome in population.values()]
+        self.publisher.publish({
+            "type": "generation",
+            "generation": self.generation,
+            "best": best_genome.fitness,
+            "mean": sum(fitnesses) / len(fitnesses),
+            "species": len(species.species),
+        })
+
+
+class TelemetryListener:
+    def __init__(self, host=TELEMETRY_HOST, port=TELEMETRY_PORT):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port))
+        self.sock.setblocking(False)
+
+    def poll(self):
+        # Drain everything that arrived since the last call without waiting
+        messages = []
+        while True:
+            try:
+                data = self.sock.recv(MAX_MESSAGE_SIZE)
+            except BlockingIOError:
+                break
+            try:
+                messages.append(json.loads(data))
+            except ValueError:
+                continue  # Ignore anything that is not one of our messages
+        return messages
+
+    def close(self):
+        self.sock.close()
@@ -0,0 +1,106 @@
+# warm_start.py
+#
+# Seeds the initial population from recorded human play (see demonstrations.py)
+# so evolution starts from basic thrust control instead of random weights.
+#
+# With initial_connection = full and num_hidden = 0 every starting network is
+# linear before its tanh outputs, so the best fit to the demonstrations is a
+# ridge regression onto the output pre-activations.
+
+import math
+import random
+
+import numpy as np
+from demonstrations import load_demos
+
+# neat's tanh is tanh(2.5 * z); an action fires when the output exceeds 0.5
+DECISION_POINT = math.atanh(0.5) / 2.5
+
+# How far on either side of the decision point the regression targets sit
+TARGET_MARGIN = 0.5
+
+
+def fit_demo_weights(inputs, actions, ridge=1e-2):
+    # Returns (weights[num_inputs, num_outputs], biases[num_outputs])
+    X = np.hstack([inputs.astype(np.float64), np.ones((len(inputs), 1))])
+    Z = np.where(actions > 0, DECISION_POINT + TARGET_MARGIN, DECISION_POINT - TARGET_MARGIN)
+
+    # Don't regularize the bias column
+    penalty = ridge * np.eye(X.shape[1])
+    penalty[-1, -1] = 0
+    solution = np.linalg.solve(X.T @ X + penalty, X.T @ Z)
+    return solution[:-1], solution[-1]
+
+
+def seed_population(population, config, weights, biases, input_std, fraction=0.5, noise=0.02):
+    # Copies the fitted weights into part of the population and returns the seeded genomes.
+    # The rest keep neat's random initialization, so the run keeps the same genetic
+    # variety (and species, though with compatibility_threshold = 3.0 a fresh random
+    # population is already a single species). The first `elitism` seeded genomes get
+    # the exact fit; the others are jittered so each input moves the pre-activation by
+    # about `noise`, well inside TARGET_MARGIN.
+    gc = config.genome_config
+
+    def clamp(value, low, high):
+        return max(low, min(high, value))
+
+    # Inputs that never vary in the demonstrations get unscaled noise
+    weight_noise = noise / np.where(input_std > 0, input_std, 1.0)
+
+    genomes = list(population.population.values())
+    random.shuffle(genomes)
+    seeded = genomes[:max(1, int(len(genomes) * fraction))]
+    exact = max(1, config.reproduction_config.elitism)
+
+    for n, genome in enumerate(seeded):
+        jitter = 0.0 if n < exact else 1.0
+        for j, output_key in enumerate(gc.output_keys):
+            node = genome.nodes[output_key]
+            bias = biases[j] + jitter * random.gauss(0, noise)
+            node.bias = clamp(bias, gc.bias_min_value, gc.bias_max_value)
+            for i, input_key in enumerate(gc.input_keys):
+                connection = genome.connections.get((input_key, output_key))
+                if connection is None:
+                    continue
+                weight = weights[i, j] / node.response + jitter * random.gauss(0, weight_noise[i])
+                connection.weight = clamp(weight, gc.weight_min_value, gc.weight_max_value)
+
+    # Weights changed, so the species assignment made by Population() is stale
+    population.species.speciate(config, population.population, population.generation)
+    return seeded
+
+
+def genome_agreement(genome, config, inputs, actions):
+    # Fraction of frames on which a (still linear) seeded genome presses the same keys as the player
+    gc = config.genome_config
+    weights = np.zeros((len(gc.input_keys), len(gc.output_keys)))
+    biases = np.zeros(len(gc.output_keys))
+    for j, output_key in enumerate(gc.output_keys):
+        node = genome.nodes[output_key]
+        biases[j] = node.bias
+        for i, input_key in enumerate(gc.input_keys):
+            connection = genome.connections.get((input_key, output_key))
+            if connection is not None and connection.enabled:
+                weights[i, j] = connection.weight * node.response
+    predicted = (inputs @ weights + biases) > DECISION_POINT
+    return np.mean(predicted == (actions > 0), axis=0)
+
+
+def format_agreement(agreement):
+    return ", ".join(f"{a:.1%}" for a in agreement)
+
+
+def warm_start(population, config, demo_dir):
+    inputs, actions = load_demos(demo_dir)
+    weights, biases = fit_demo_weights(inputs, actions)
+    seeded = seed_population(population, config, weights, biases, inputs.std(axis=0))
+
+    # How often the noise-free fit, and the genomes actually seeded, agree with the player
+    fit_agreement = np.mean(((inputs @ weights + biases) > DECISION_POINT) == (actions > 0), axis=0)
+    seeded_agreement = np.array([genome_agreement(g, config, inputs, actions) for g in seeded])
+    print(f"Warm start from {len(inputs)} demonstration frames, "
+          f"{len(seeded)}/{len(population.population)} genomes seeded, "
+          f"{len(population.species.species)} species")
+    print(f"  agreement per output: fit {format_agreement(fit_agreement)}; "
+          f"seeded mean {format_agreement(seeded_agreement.mean(axis=0))}, "
+          f"min {format_agreement(seeded_agreement.min(axis=0))}")